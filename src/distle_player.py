@@ -1,6 +1,17 @@
 from edit_dist_utils import *
+from collections import Counter, defaultdict
 import random
 
+# The max number of remaining words for which every one of them is scored as the
+# next guess against all of the others in make_guess
+FULL_SCORING_LIMIT: int = 200
+
+# Past FULL_SCORING_LIMIT, the number of remaining words tried as the next guess
+GUESS_SAMPLE_SIZE: int = 20
+
+# Past FULL_SCORING_LIMIT, the number of remaining words each tried guess is scored against
+TARGET_SAMPLE_SIZE: int = 100
+
 class DistlePlayer:
     '''
     AI Distle Player! Contains all of the logic to automagically play
@@ -28,46 +39,28 @@ class DistlePlayer:
         - dictionary (set[str]): The provided dictionary of words for the game.
         - new_dict (set[str]): A modifiable copy of the dictionary to be used in each game.
         - total_guesses (int): Tracks the current number of guesses made, initialized to 0.
+        - words_by_length (dict[int, set[str]]): The words still in the dictionary, grouped by their length.
         - first_match (str): The initial word guess, chosen based on common letter and length criteria.
         '''
         self.dictionary: set[str] = dictionary
         self.new_dict: set[str] = dictionary
         self.total_guesses: int = 0
-
-        # Gets the lengths of every word
-        length_counts: dict[int, int] = {}
+        self.words_by_length: dict[int, set[str]] = defaultdict(set)
         for word in self.dictionary:
-            length = len(word)
-            if length in length_counts:
-                length_counts[length] += 1
-            else:
-                length_counts[length] = 1
+            self.words_by_length[len(word)].add(word)
 
         # Gets the most common length of the words
-        most_common_length = 0
-        highest_count = 0
-        for length, count in length_counts.items():
-            if count > highest_count:
-                most_common_length = length
-                highest_count = count
+        length_counts = Counter(map(len, self.dictionary))
+        most_common_length, _ = length_counts.most_common(1)[0]
 
         matching_words = [word for word in self.dictionary if len(word) == most_common_length]
 
-        # Gets the number of times every letter is used
-        letter_counts: dict[str, int] = {}
-        for word in matching_words:
-            for letter in word:
-                if letter in letter_counts:
-                    letter_counts[letter] += 1
-                else:
-                    letter_counts[letter] = 1
-                    
-        # Finds the x most common letters, x being the most common number of letters of the words      
-        sorted_letter_counts = sorted(letter_counts.items(), key=lambda item: item[1], reverse=True)
-        common_letters = [letter for letter, _ in sorted_letter_counts[:most_common_length]]
+        # Finds the x most common letters, x being the most common number of letters of the words
+        letter_counts = Counter(letter for word in matching_words for letter in word)
+        common_letters = {letter for letter, _ in letter_counts.most_common(most_common_length)}
 
         # Finds every word using the most common letters with the most common length
-        best_words = [word for word in matching_words if all(letter in word for letter in common_letters)]
+        best_words = [word for word in matching_words if common_letters.issubset(word)]
 
         self.first_match = random.choice(best_words) if best_words else random.choice(matching_words)
 
@@ -86,13 +79,48 @@ class DistlePlayer:
             str:
                 The next guessed word from this DistlePlayer
         '''
-        # Gets best first word at the beginning, after chooses a random word from the updated list
+        # Gets best first word at the beginning, after picks the remaining word that rules out the most
         if self.total_guesses == 0:
             self.total_guesses += 1
             return self.first_match
         else:
             self.total_guesses += 1
-            return random.choice(list(self.dictionary))
+            remaining_words = list(self.dictionary)
+            if len(remaining_words) <= 2:
+                return random.choice(remaining_words)
+
+            # Scores every remaining word against the rest, or only samples of them when too many remain
+            guesses = targets = remaining_words
+            if len(remaining_words) > FULL_SCORING_LIMIT:
+                guesses = random.sample(remaining_words, GUESS_SAMPLE_SIZE)
+                targets = random.sample(remaining_words, TARGET_SAMPLE_SIZE)
+            return min(guesses, key=lambda guess: self.get_worst_case_remaining(guess, targets))
+
+    def get_worst_case_remaining(self, guess: str, targets: list[str]) -> int:
+        '''
+        Returns the number of the given target words that would still remain after
+        guessing the given word, in the worst case. Each target would produce some
+        feedback for get_feedback (an edit distance and a list of transforms), and
+        the targets that share both can't be told apart, so the largest group of
+        them is what might be left.
+        
+        Parameters:
+            guess (str):
+                The word that could be guessed next
+            targets (list[str]):
+                The words that could be the secret word
+        
+        Returns:
+            int:
+                The size of the largest group of targets sharing the same feedback
+        '''
+        feedback_counts: Counter[tuple[int, tuple[str, ...]]] = Counter()
+        for target in targets:
+            # Every target's distance is needed, so the whole table is built rather than a band
+            dist, table = edit_info(guess, target)
+            transforms = get_transformation_list_with_table(guess, target, table)
+            feedback_counts[(dist, tuple(transforms))] += 1
+        return max(feedback_counts.values())
    
 
     def get_feedback(self, guess: str, edit_dist: int, transforms: list[str]) -> None:
@@ -116,6 +144,24 @@ class DistlePlayer:
                 secret word, i.e., the transforms that would be returned by your
                 get_transformation_list(guess, secret_word)
         '''
+        remaining_words: set[str] = set()
+
+        # Only insertions and deletions change the length, so the secret word's length is already known
+        secret_length = len(guess) + transforms.count('I') - transforms.count('D')
+
+        # Only the words of that length are looked at, and their exact distance is checked before building any table
+        guess_masks = get_letter_masks(guess)
+        for word in self.words_by_length[secret_length]:
+            if get_bit_parallel_edit_dist(guess, guess_masks, word) != edit_dist:
+                continue
+
+            # The distance matches, so only the band of the table that can cost edit_dist is needed to trace it back
+            table = get_banded_edit_dist_table(guess, word, edit_dist)
+            if table is not None and transforms == get_transformation_list_with_table(guess, word, table):
+                remaining_words.add(word)
+
         # Removes all words that do not have same transformations from the initial guess
-        self.dictionary = {word for word in self.dictionary if transforms == get_transformation_list(guess, word)}
+        self.dictionary = remaining_words
+        self.words_by_length.clear()
+        self.words_by_length[secret_length] = remaining_words
         return
\ No newline at end of file
@@ -1,5 +1,7 @@
 import unittest
 import pytest
+import edit_dist_utils
+from unittest import mock
 from edit_dist_utils import *
 
 class EditDistUtilTests(unittest.TestCase):
@@ -47,6 +49,23 @@ class EditDistUtilTests(unittest.TestCase):
     def test_edit_dist_t7(self) -> None:
         self.assertEqual(4, edit_distance("aaaabcde", "aaaedbca"))
         
+    def test_edit_dist_t8(self) -> None:
+        self.assertEqual(2, edit_distance("a", "aaa"))
+        self.assertEqual(2, edit_distance("aaa", "a"))
+        self.assertEqual(7, edit_distance("cabbc", "bccdcdda"))
+        
+    def test_edit_dist_value_t0(self) -> None:
+        for s0, s1 in [("", "abc"), ("abc", ""), ("hack", "fkc"), ("wxyyxw", "wyxxyx"), ("aaaabcde", "aaaedbca")]:
+            table = get_edit_dist_table(s0, s1)
+            self.assertEqual(table[len(s0)][len(s1)], get_edit_dist_value(s0, s1))
+        
+    def test_edit_info_t0(self) -> None:
+        for s0, s1 in [("", ""), ("abc", ""), ("hack", "fkc"), ("astound", "distant")]:
+            dist, table = edit_info(s0, s1)
+            self.assertEqual(edit_distance(s0, s1), dist)
+            self.assertEqual(get_edit_dist_table(s0, s1), table)
+            self.assertEqual(get_transformation_list(s0, s1), get_transformation_list_with_table(s0, s1, table))
+        
     # Transform List Tests
     # -------------------------------------------------
     
@@ -121,5 +140,46 @@ class EditDistUtilTests(unittest.TestCase):
         self.assertEqual(["R", "R", "T"], get_transformation_list(s0, s1))
         self.assertEqual(["R", "R", "T"], get_transformation_list(s1, s0))
         
+    def test_transform_list_with_table_t0(self) -> None:
+        s0 = "hack"
+        s1 = "fkc"
+        table = get_edit_dist_table(s0, s1)
+        with mock.patch.object(edit_dist_utils, "get_edit_dist_table", side_effect=AssertionError("table was recomputed")):
+            self.assertEqual(["T", "R", "D"], get_transformation_list_with_table(s0, s1, table))
+        
+    # Banded Table Tests
+    # -------------------------------------------------
+    
+    def test_banded_edit_dist_table_t0(self) -> None:
+        self.assertIsNone(get_banded_edit_dist_table("a", "abcd", 2))
+        self.assertIsNone(get_banded_edit_dist_table("cat", "dog", 2))
+        self.assertIsNone(get_banded_edit_dist_table("abcde", "edbca", 3))
+        self.assertIsNone(get_banded_edit_dist_table("bb", "bca", 1))
+        
+    def test_banded_edit_dist_table_t1(self) -> None:
+        for s0, s1 in [("hack", "fkc"), ("astound", "distant"), ("axbczy", "abxyzc"), ("abcde", "edbca")]:
+            dist = edit_distance(s0, s1)
+            table = get_banded_edit_dist_table(s0, s1, dist)
+            assert table is not None
+            self.assertEqual(dist, table[-1][-1])
+            self.assertEqual(get_transformation_list(s0, s1), get_transformation_list_with_table(s0, s1, table))
+        
+    # Bit-Parallel Tests
+    # -------------------------------------------------
+    
+    def test_bit_parallel_edit_dist_t0(self) -> None:
+        self.assertEqual(0, get_bit_parallel_edit_dist("", get_letter_masks(""), ""))
+        self.assertEqual(2, get_bit_parallel_edit_dist("", get_letter_masks(""), "aa"))
+        self.assertEqual(2, get_bit_parallel_edit_dist("aa", get_letter_masks("aa"), ""))
+        self.assertEqual(1, get_bit_parallel_edit_dist("ab", get_letter_masks("ab"), "ba"))
+        self.assertEqual(2, get_bit_parallel_edit_dist("a", get_letter_masks("a"), "aaa"))
+        
+    def test_bit_parallel_edit_dist_t1(self) -> None:
+        pairs = [("hack", "fkc"), ("parisss", "parsimony"), ("wxyyxw", "wyxxyx"), ("abcde", "edbca"),
+                 ("aaaabcde", "aaaedbca"), ("axbczy", "abxyzc"), ("cabbc", "bccdcdda")]
+        for s0, s1 in pairs:
+            self.assertEqual(edit_distance(s0, s1), get_bit_parallel_edit_dist(s0, get_letter_masks(s0), s1))
+            self.assertEqual(edit_distance(s1, s0), get_bit_parallel_edit_dist(s1, get_letter_masks(s1), s0))
+        
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
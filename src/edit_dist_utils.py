@@ -8,6 +8,7 @@ provide feedback to the DistlePlayer during a game of Distle.
 [!] Feel free to ADD any methods you see fit for use by your DistlePlayer,
 e.g., some form of entropy computation.
 '''
+from typing import Optional
 
 def get_edit_dist_table(row_str: str, col_str: str) -> list[list[int]]:
     '''
@@ -28,36 +29,134 @@ def get_edit_dist_table(row_str: str, col_str: str) -> list[list[int]]:
     '''
     
     rows, cols = len(row_str), len(col_str)
-    memo_table: list[list[int]] = []
-    memo_table = [[0] * (cols + 1) for item in range(rows + 1)]
+    memo_table: list[list[int]] = [list(range(cols + 1))]
+
+    # Each row is allocated once, already holding its first column, right before it's filled in
+    for row_index in range(1, rows + 1):
+        current_row = [row_index] * (cols + 1)
+        memo_table.append(current_row)
+        fill_edit_dist_row(row_str, col_str, row_index, current_row, memo_table[row_index - 1], memo_table[row_index - 2], 1, cols)
+    return memo_table
+
+def get_edit_dist_value(row_str: str, col_str: str) -> int:
+    '''
+    Returns only the final cell of the Edit Distance memoization structure,
+    i.e., edit_distance(row_str, col_str). Since each row only depends on
+    the two above it, just three rows are kept around and reused rather than
+    building the whole table.
+    
+    Parameters:
+        row_str (str):
+            The string located along the table's rows
+        col_str (str):
+            The string located along the table's columns
+    
+    Returns:
+        int:
+            The minimal number of string manipulations
+    '''
+    cols = len(col_str)
+    two_above_row = [0] * (cols + 1)
+    above_row = list(range(cols + 1))
+    current_row = [0] * (cols + 1)
+    
+    for row_index in range(1, len(row_str) + 1):
+        current_row[0] = row_index
+        fill_edit_dist_row(row_str, col_str, row_index, current_row, above_row, two_above_row, 1, cols)
+        two_above_row, above_row, current_row = above_row, current_row, two_above_row
+    return above_row[cols]
+
+def get_banded_edit_dist_table(row_str: str, col_str: str, max_dist: int) -> Optional[list[list[int]]]:
+    '''
+    Returns the Edit Distance memoization structure like get_edit_dist_table,
+    except that only the cells within max_dist of the table's main diagonal
+    are computed, since no cell further out can cost max_dist or less. Cells
+    outside of that band are left holding max_dist + 1, so the work done is
+    proportional to the length of the strings times max_dist.
+    
+    Every cell of the table whose true value is at most max_dist is exact,
+    so the table can be traced back exactly like a complete one whenever its
+    final cell is at most max_dist.
+    
+    Parameters:
+        row_str (str):
+            The string located along the table's rows
+        col_str (str):
+            The string located along the table's columns
+        max_dist (int):
+            The largest edit distance of interest
+    
+    Returns:
+        Optional[list[list[int]]]:
+            The banded memoization table, or None whenever
+            edit_distance(row_str, col_str) exceeds max_dist
+    '''
+    rows, cols = len(row_str), len(col_str)
+    if abs(rows - cols) > max_dist:
+        return None
+    
+    out_of_band = max_dist + 1
+    memo_table = [[out_of_band] * (cols + 1) for item in range(rows + 1)]
     
-    for col_index in range(1, cols + 1):
+    for col_index in range(min(cols, max_dist) + 1):
         memo_table[0][col_index] = col_index
 
-    for row_index in range(1, rows + 1):
+    for row_index in range(1, min(rows, max_dist) + 1):
         memo_table[row_index][0] = row_index
 
     for row_index in range(1, rows + 1):
-        for col_index in range(1, cols + 1):
-            delete_value = insert_value = replace_value = transpose_value = rows + cols + 1
-            delete_value = memo_table[row_index - 1][col_index] + 1
-            insert_value = memo_table[row_index][col_index - 1] + 1
-            replace_value = memo_table[row_index - 1][col_index - 1] 
-            
-            if row_str[row_index - 1] != col_str[col_index - 1]:
-                replace_value += 1
-
-            transpose_value = rows + cols + 1
-            if (
-                row_index + col_index > 2 and
-                row_str[row_index - 1] == col_str[col_index - 2] and 
-                row_str[row_index - 2] == col_str[col_index - 1]
-            ):
-                transpose_value = memo_table[row_index - 2][col_index - 2] + 1
-                
-            memo_table[row_index][col_index] = min(delete_value, insert_value, replace_value, transpose_value)
+        first_col = max(1, row_index - max_dist)
+        last_col = min(cols, row_index + max_dist)
+        fill_edit_dist_row(row_str, col_str, row_index, memo_table[row_index], memo_table[row_index - 1], memo_table[row_index - 2], first_col, last_col)
+        
+        # Costs never shrink from one row to the next, so stop once a row's band is out of reach
+        if min(memo_table[row_index][first_col - 1:last_col + 1]) > max_dist:
+            return None
+    
+    if memo_table[rows][cols] > max_dist:
+        return None
     return memo_table
 
+def fill_edit_dist_row(row_str: str, col_str: str, row_index: int, current_row: list[int], above_row: list[int], two_above_row: list[int], first_col: int, last_col: int) -> None:
+    '''
+    Fills in the cells of a single row of the Edit Distance memoization
+    structure from first_col to last_col (inclusive), assuming that the
+    two rows above it and the cell left of first_col are already filled in.
+    
+    Parameters:
+        row_str (str):
+            The string located along the table's rows
+        col_str (str):
+            The string located along the table's columns
+        row_index (int):
+            The index of the row being filled in
+        current_row, above_row, two_above_row (list[int]):
+            The row being filled in and the two rows above it
+        first_col, last_col (int):
+            The range of columns of the row to fill in
+    '''
+    # The row's letters don't change across its columns, so they're only looked up once
+    row_letter = row_str[row_index - 1]
+    prev_row_letter = row_str[row_index - 2] if row_index > 1 else ""
+    for col_index in range(first_col, last_col + 1):
+        col_letter = col_str[col_index - 1]
+        delete_value = above_row[col_index] + 1
+        insert_value = current_row[col_index - 1] + 1
+        replace_value = above_row[col_index - 1] + (row_letter != col_letter)
+        cell_value = min(delete_value, insert_value, replace_value)
+
+        # Transpositions are rare, so they're the only case left to branch on
+        if (
+            col_index > 1 and
+            row_letter == col_str[col_index - 2] and
+            prev_row_letter == col_letter
+        ):
+            transpose_value = two_above_row[col_index - 2] + 1
+            if transpose_value < cell_value:
+                cell_value = transpose_value
+
+        current_row[col_index] = cell_value
+
 
 
 def edit_distance(s0: str, s1: str) -> int:
@@ -78,9 +177,99 @@ def edit_distance(s0: str, s1: str) -> int:
             The minimal number of string manipulations
     '''
     if s0 == s1: return 0
-    return get_edit_dist_table(s0, s1)[len(s0)][len(s1)]
+    return get_edit_dist_value(s0, s1)
 
 
+def edit_info(s0: str, s1: str) -> tuple[int, list[list[int]]]:
+    '''
+    Returns both the edit distance between two given strings and the completed
+    memoization table it was read from, so that callers who also need the
+    transformation list can pass the same table to get_transformation_list_with_table
+    instead of building it twice.
+    
+    Parameters:
+        s0, s1 (str):
+            The strings to compute the edit distance between
+    
+    Returns:
+        tuple[int, list[list[int]]]:
+            The minimal number of string manipulations, and the memoization
+            table of get_edit_dist_table(s0, s1)
+    '''
+    table = get_edit_dist_table(s0, s1)
+    return table[len(s0)][len(s1)], table
+
+def get_letter_masks(s0: str) -> dict[str, int]:
+    '''
+    Returns the bitmasks of where each letter appears in s0, as needed by
+    get_bit_parallel_edit_dist. Computed once per s0 so that they can be
+    reused across many s1.
+    
+    Parameters:
+        s0 (str):
+            The string to find the letter positions of
+    
+    Returns:
+        dict[str, int]:
+            Maps each letter of s0 to an int with bit i set wherever s0[i] is
+            that letter
+    '''
+    letter_masks: dict[str, int] = {}
+    for index, letter in enumerate(s0):
+        letter_masks[letter] = letter_masks.get(letter, 0) | (1 << index)
+    return letter_masks
+
+def get_bit_parallel_edit_dist(s0: str, s0_masks: dict[str, int], s1: str) -> int:
+    '''
+    Returns edit_distance(s0, s1), computed one column of the memoization
+    table at a time using Myers' bit-parallel algorithm with Hyyro's extension
+    for Transpositions. Rather than storing a column's values, it stores which
+    of its cells are exactly one more (vertical_pos) or one less (vertical_neg)
+    than the cell above, as one bit per row of s0, so a whole column is
+    updated with a handful of int operations instead of one step per cell.
+    
+    Parameters:
+        s0 (str):
+            The string located along the table's rows
+        s0_masks (dict[str, int]):
+            The result of get_letter_masks(s0)
+        s1 (str):
+            The string located along the table's columns
+    
+    Returns:
+        int:
+            The minimal number of string manipulations
+    '''
+    rows = len(s0)
+    if rows == 0:
+        return len(s1)
+    
+    all_rows = (1 << rows) - 1
+    last_row = 1 << (rows - 1)
+    vertical_pos, vertical_neg = all_rows, 0
+    diagonal_zero = prev_match = 0
+    dist = rows
+    
+    for letter in s1:
+        match = s0_masks.get(letter, 0)
+        transpose = (((~diagonal_zero) & match) << 1) & prev_match
+        diagonal_zero = ((((match & vertical_pos) + vertical_pos) ^ vertical_pos) | match | vertical_neg | transpose) & all_rows
+        horizontal_pos = vertical_neg | ~(diagonal_zero | vertical_pos)
+        horizontal_neg = diagonal_zero & vertical_pos
+        
+        # Tracks the bottom cell of the column, i.e., the distance so far
+        if horizontal_pos & last_row:
+            dist += 1
+        elif horizontal_neg & last_row:
+            dist -= 1
+        
+        horizontal_pos = ((horizontal_pos << 1) | 1) & all_rows
+        horizontal_neg = (horizontal_neg << 1) & all_rows
+        vertical_pos = horizontal_neg | (~(diagonal_zero | horizontal_pos) & all_rows)
+        vertical_neg = diagonal_zero & horizontal_pos
+        prev_match = match
+    return dist
+
 def get_transformation_list(s0: str, s1: str) -> list[str]:
     '''
     Returns one possible sequence of transformations that turns String s0
@@ -124,9 +313,9 @@ def get_transformation_list_with_table(s0: str, s1: str, table: list[list[int]])
     and is being used by multiple methods.
     
     [!] MUST use the already-solved memoization table and must NOT recompute it.
-    [!] MUST be implemented recursively (i.e., in top-down fashion)
+    [!] Traces the table back in top-down fashion (i.e., from the largest subproblem)
     '''
-    return transformation_list_with_table(s0, s1, [], get_edit_dist_table(s0, s1))
+    return transformation_list_with_table(s0, s1, [], table)
     
 def transformation_list_with_table(s0: str, s1: str, complete_transform_list: list[str], table: list[list[int]]) -> list[str]:
     '''
@@ -134,7 +323,9 @@ def transformation_list_with_table(s0: str, s1: str, complete_transform_list: li
     using the provided memoization table.
 
     This function traces the transformation path based on a memoization table, which contains 
-    the minimum edit distances for substrings of s0 and s1.
+    the minimum edit distances for substrings of s0 and s1. Starting from the bottom-right cell, it steps
+    back along the minimal-cost path one cell at a time, appending the corresponding operation at each step,
+    with tiebreaker priorities: Replace ('R') > Transpose ('T') > Insert ('I') > Delete ('D').
 
     Args:
         s0 (str): The source string.
@@ -148,82 +339,46 @@ def transformation_list_with_table(s0: str, s1: str, complete_transform_list: li
     row_index: int = len(s0)
     col_index: int = len(s1)
     memo_table = table
-    
-    def get_transformation(s0: str, s1: str, row_index: int, col_index: int, transform_list: list[str], memo_table: list[list[int]]) -> list[str]:
-        """
-        Recursively traces back through the memoization table to generate a sequence of transformation operations 
-        (Insert, Delete, Replace, Transpose) that converts string s0 into string s1.
-
-        This function uses the provided memoization table, which contains the minimum edit distances between substrings 
-        of s0 and s1, to identify the optimal transformation path. It compares the values for each operation (insert, 
-        delete, replace, and transpose) and appends the corresponding operation ('I', 'D', 'R', 'T') to the 
-        transformation list. The recursive trace follows the minimal-cost path, with tiebreaker priorities: 
-        Replace ('R') > Transpose ('T') > Insert ('I') > Delete ('D').
-
-        Args:
-            s0 (str): The original string.
-            s1 (str): The target string.
-            row_index (int): The current row index in the memoization table.
-            col_index (int): The current column index in the memoization table.
-            transform_list (list[str]): A list to accumulate the sequence of transformation operations.
-            memo_table (list[list[int]]): The memoization table that stores the minimum edit distances for substrings of s0 and s1.
-
-        Returns:
-            list[str]: A list of transformation operations ('I', 'D', 'R', 'T') that transform s0 into s1.
-        """
-        # If goal position in tabel reached, return transformations
-        if row_index == 0 and col_index == 0:
-            return transform_list[::-1]
-        
+
+    # Once either string runs out, only insertions or deletions remain
+    while row_index > 0 and col_index > 0:
         #Get values from table
         current_value = memo_table[row_index][col_index]
-        delete_value = insert_value = replace_value = transpose_value = len(s0) + len(s1) + 1 # >> [AM] What's the point of this line if you immediately replace the values below
-
-        delete_value = memo_table[row_index - 1][col_index] 
-        insert_value = memo_table[row_index][col_index - 1] 
+        row_letter = s0[row_index - 1]
+        col_letter = s1[col_index - 1]
 
         replace_value = memo_table[row_index - 1][col_index - 1]
-        if s0[row_index - 1] != s1[col_index - 1]:
+        if row_letter != col_letter:
             replace_value += 1
-            
-        transpose_value = memo_table[row_index - 2][col_index - 2]
 
+        # Tiebreaker implementation, stepping back to the chosen subproblem
+        if replace_value <= current_value:
+            if row_letter != col_letter:
+                complete_transform_list.append('R')
+            row_index -= 1
+            col_index -= 1
+
+        elif (row_index > 1 and col_index > 1 and
+              memo_table[row_index - 2][col_index - 2] <= current_value and
+              row_letter == s1[col_index - 2] and
+              s0[row_index - 2] == col_letter):
+            complete_transform_list.append('T')
+            row_index -= 2
+            col_index -= 2
 
-        # Tiebreaker implementation with recursion
-        if replace_value <= current_value and (row_index > 0 and col_index > 0):
-            if s0[row_index - 1] != s1[col_index - 1]:
-                transform_list.append('R')
-            return get_transformation(s0, s1, row_index - 1, col_index - 1, transform_list, memo_table)
+        elif memo_table[row_index][col_index - 1] <= current_value:
+            complete_transform_list.append('I')
+            col_index -= 1
 
-        if transpose_value <= current_value and (row_index > 1 and col_index > 1 and 
-                                                 s0[row_index - 1] == s1[col_index - 2] and 
-                                                 s0[row_index - 2] == s1[col_index - 1]):
-            transform_list.append('T')
-            return get_transformation(s0, s1, row_index - 2, col_index - 2, transform_list, memo_table)
+        elif memo_table[row_index - 1][col_index] <= current_value:
+            complete_transform_list.append('D')
+            row_index -= 1
 
-        if insert_value <= current_value and col_index > 0:
-            transform_list.append('I')
-            return get_transformation(s0, s1, row_index, col_index - 1, transform_list, memo_table)
-        
-        if delete_value <= current_value and row_index > 0:
-            transform_list.append('D')
-            return get_transformation(s0, s1, row_index - 1, col_index, transform_list, memo_table)
-        
         else:
             return []
 
-    # Handles empty strings
-    if col_index <= 0: # >> [AM] probably best to put this code at the top of the function so you don't waste time with the other calculations if it's an empty string
-        while row_index > 0:
-            complete_transform_list.append('D')
-            row_index -= 1
-    elif row_index <= 0:
-        while col_index > 0:
-            complete_transform_list.append('I')
-            col_index -= 1
-    else:       
-        get_transformation(s0, s1, row_index, col_index, complete_transform_list, memo_table) # Root call
-        
+    complete_transform_list.extend('D' * row_index)
+    complete_transform_list.extend('I' * col_index)
     return complete_transform_list
 
 # ===================================================